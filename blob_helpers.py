@@ -3,11 +3,34 @@
 import logging
 import os
 from azure.storage.blob import ContainerClient
+from config import BLOB_MAX_SINGLE_PUT_SIZE, BLOB_MAX_BLOCK_SIZE, BLOB_MAX_CONCURRENCY
+
+
+# Container clients by SAS URL, reused across warm invocations
+
+_container_clients = {}
 
 
 ##### BLOB STORAGE HELPERS #####
 
 
+def get_container_client(sas_url):
+    
+    """Get a cached container client so warm invocations reuse its connection pool"""
+    
+    container_client = _container_clients.get(sas_url)
+    
+    if container_client is None:
+        container_client = ContainerClient.from_container_url(
+            sas_url,
+            max_single_put_size=BLOB_MAX_SINGLE_PUT_SIZE,
+            max_block_size=BLOB_MAX_BLOCK_SIZE,
+        )
+        _container_clients[sas_url] = container_client
+    
+    return container_client
+
+
 def upload_csv_to_blob(csv_file_path):
    
     """Upload CSV to blob storage for middleware"""
@@ -19,14 +42,20 @@ def upload_csv_to_blob(csv_file_path):
             logging.error("BLOB_SAS_URL not configured")
             return False
         
-        container_client = ContainerClient.from_container_url(sas_url)
+        container_client = get_container_client(sas_url)
         
         file_name = os.path.basename(csv_file_path)
         blob_name = f"Leads/Production/{file_name}"
+        length = os.path.getsize(csv_file_path)
         
-        with open(csv_file_path, "rb") as data:
+        with open(csv_file_path, "rb", buffering=1024 * 1024) as data:
             blob_client = container_client.get_blob_client(blob=blob_name)
-            blob_client.upload_blob(data, overwrite=True)
+            blob_client.upload_blob(
+                data,
+                overwrite=True,
+                length=length,
+                max_concurrency=BLOB_MAX_CONCURRENCY,
+            )
         
         logging.info(f"Uploaded file to blob storage: {blob_name}")
         return True
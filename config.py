@@ -7,6 +7,33 @@ import os
 SITE_ID = os.environ.get("SHAREPOINT_SITE_ID", "")
 LEADS_DRIVE_ID = os.environ.get("SHAREPOINT_DRIVE_ID", "")
 
+# Graph API connection limits (keeps concurrent calls under Graph throttling)
+
+GRAPH_MAX_CONNECTIONS = 5
+GRAPH_MAX_RETRIES = 3
+
 # Dodge API Configuration
 
-DODGE_API_BASE_URL = "https://www.construction.com/api/1.0/int"
\ No newline at end of file
+DODGE_API_BASE_URL = "https://www.construction.com/api/1.0/int"
+
+# Dodge API pagination (page size is the API's maximum limit per request)
+
+DODGE_API_PAGE_SIZE = 100
+DODGE_API_MAX_PAGES = 50
+DODGE_API_MAX_WORKERS = 8
+
+# Dodge API connection settings (connect, read) timeouts in seconds
+
+DODGE_API_TIMEOUT = (5, 60)
+DODGE_API_MAX_RETRIES = 3
+
+# Blob storage upload settings (files larger than one put are sent as
+# blocks, with up to BLOB_MAX_CONCURRENCY blocks in flight at once)
+
+BLOB_MAX_SINGLE_PUT_SIZE = 4 * 1024 * 1024
+BLOB_MAX_BLOCK_SIZE = 4 * 1024 * 1024
+BLOB_MAX_CONCURRENCY = 8
+
+# Tracking file: number of most recent API runs kept in api_runs
+
+MAX_API_RUNS = 500
\ No newline at end of file
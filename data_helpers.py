@@ -1,7 +1,73 @@
 # Data extraction and formatting helper functions
 
 import logging
+import re
 from datetime import datetime
+from functools import lru_cache
+
+
+# Accepted input date formats, tried in order
+DATE_FORMATS = (
+    "%Y-%m-%d",      # 2025-10-31
+    "%d/%m/%Y",      # 31/10/2025 
+    "%m/%d/%Y",      # 10/31/2025 
+    "%Y/%m/%d",      # 2025/10/31
+    "%d-%m-%Y",      # 31-10-2025
+    "%m-%d-%Y",      # 10-31-2025
+)
+
+# Any run of whitespace characters, collapsed by clean_text
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=None)
+def _compile_path(path):
+    
+    """
+    Generate (once per unique path) a straight-line accessor for the given keys
+    
+    The source is unrolled per key, so a lookup runs without looping over
+    the path or packing *args
+    
+    Args:
+        path: Tuple of keys to navigate through
+    
+    Returns:
+        Function taking the JSON object and returning the extracted value
+    """
+    
+    namespace = {}
+    lines = ["def accessor(current):"]
+    
+    for i, key in enumerate(path):
+        namespace[f"key_{i}"] = key
+        lines.append("    if type(current) is not dict: return ''")
+        lines.append(f"    current = current.get(key_{i}, {{}})")
+    
+    # Unwrap ci/value structure
+    lines.append("    if type(current) is dict and 'value' in current:")
+    lines.append("        value = current['value']")
+    lines.append("        return value if value is not None else ''")
+    lines.append("    return current if current is not None else ''")
+    
+    exec("\n".join(lines), namespace)
+    
+    return namespace["accessor"]
+
+
+def compile_json_path(*path):
+    
+    """
+    Get a reusable accessor for a fixed JSON path (same rules as get_json_value)
+    
+    Args:
+        *path: Keys to navigate through (e.g., 'value', 'summary', 'dodgeReportNumber')
+    
+    Returns:
+        Function taking the JSON object and returning the extracted value
+    """
+    
+    return _compile_path(path)
 
 
 def get_json_value(data, *path):
@@ -19,21 +85,7 @@ def get_json_value(data, *path):
     """
     
     try:
-        current = data
-        # Navigate through each key in the path
-        for key in path:
-            if isinstance(current, dict):
-                current = current.get(key, {})
-            else:
-                return ""
-        
-        # Check if it has ci/value structure
-        if isinstance(current, dict) and 'value' in current:
-            # Extract just the value part
-            return current['value'] if current['value'] is not None else ""
-        
-        # Otherwise return the value as-is
-        return current if current is not None else ""
+        return _compile_path(path)(data)
         
     except Exception as e:
         logging.warning(f"Error extracting value at path {path}: {e}")
@@ -83,11 +135,30 @@ def format_phone(area_code, number):
    
     if area_code and number:
         return f"{area_code}-{number}"
-    elif number:
-        return number
-    elif area_code:
-        return area_code
-    return ""
+    
+    # One side (or neither) present
+    return number or area_code or ""
+
+
+def format_zip_code(zip5):
+    
+    """
+    Format a 5-digit zip code, restoring leading zeros lost to numeric values
+    
+    Args:
+        zip5: Zip code as a string or number (e.g., "38103", 501)
+    
+    Returns:
+        Zero-padded zip string (e.g., "00501"), or empty if missing
+    """
+    
+    if not zip5:
+        return ""
+    
+    # Most zips arrive as 5-character strings; avoid re-allocating them
+    zip_str = zip5 if type(zip5) is str else str(zip5)
+    
+    return zip_str if len(zip_str) == 5 else zip_str.zfill(5)
 
 
 def format_date_to_iso(date_value):
@@ -118,21 +189,40 @@ def format_date_to_iso(date_value):
     else:
         return ""
     
+    if not isinstance(date_string, str):
+        logging.warning(f"Error formatting date '{date_string}': not a string")
+        return ""
+    
+    return _parse_date_string(date_string)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_string):
+    
+    """
+    Parse a raw date string into ISO format (cached, dates repeat across projects)
+    
+    Args:
+        date_string: Date string in one of DATE_FORMATS, optionally with time/timezone
+    
+    Returns:
+        Formatted date string in ISO format, or empty string if unparseable
+    """
+    
     try:
         # Remove timezone info if present (Z or +00:00)
         date_clean = date_string.replace('Z', '').split('+')[0].split('T')[0].strip()
         
-        # Try multiple date formats
-        date_formats = [
-            "%Y-%m-%d",      # 2025-10-31
-            "%d/%m/%Y",      # 31/10/2025 
-            "%m/%d/%Y",      # 10/31/2025 
-            "%Y/%m/%d",      # 2025/10/31
-            "%d-%m-%Y",      # 31-10-2025
-            "%m-%d-%Y"       # 10-31-2025
-        ]
+        # Fast path for YYYY-MM-DD, the format the API returns
+        if len(date_clean) == 10 and date_clean[4] == '-' and date_clean[7] == '-':
+            try:
+                dt = datetime(int(date_clean[:4]), int(date_clean[5:7]), int(date_clean[8:10]))
+                return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T00:00:00"
+            except ValueError:
+                pass
         
-        for fmt in date_formats:
+        # Try multiple date formats
+        for fmt in DATE_FORMATS:
             try:
                 dt = datetime.strptime(date_clean, fmt)
                 return dt.strftime("%Y-%m-%dT00:00:00")
@@ -151,7 +241,7 @@ def format_date_to_iso(date_value):
 def clean_text(value):
     
     """
-    Clean text by trimming whitespace and removing newlines/carriage returns
+    Clean text by trimming whitespace and collapsing newlines/tabs/runs of spaces
     
     Args:
         value: Any value (string or other)
@@ -163,12 +253,5 @@ def clean_text(value):
     if not isinstance(value, str):
         return value
     
-    # Replace newlines and carriage returns with space
-    cleaned = value.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ')
-    
-    # Replace multiple spaces with single space
-    while '  ' in cleaned:
-        cleaned = cleaned.replace('  ', ' ')
-    
-    # Trim leading/trailing whitespace
-    return cleaned.strip()
\ No newline at end of file
+    # Replace any run of whitespace (including newlines) with a single space and trim
+    return WHITESPACE_RE.sub(' ', value).strip()
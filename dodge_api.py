@@ -1,38 +1,218 @@
 # API interaction functions
 
+import csv
 import logging
+import math
 import os
+import orjson
 import requests
-import pandas as pd
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from config import DODGE_API_BASE_URL
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import (
+    DODGE_API_BASE_URL,
+    DODGE_API_PAGE_SIZE,
+    DODGE_API_MAX_PAGES,
+    DODGE_API_MAX_WORKERS,
+    DODGE_API_TIMEOUT,
+    DODGE_API_MAX_RETRIES,
+)
 from country_codes import get_country_code
-from data_helpers import get_json_value, get_owner_contact, format_phone, format_date_to_iso, clean_text
+from data_helpers import compile_json_path, get_owner_contact, format_phone, format_zip_code, format_date_to_iso, clean_text
+
+
+# Shared keep-alive session, reused across warm invocations. Search is read-only,
+# so POSTs are safe to retry on throttling and transient server errors.
+
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=DODGE_API_MAX_WORKERS,
+        max_retries=Retry(
+            total=DODGE_API_MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+# Accessors for fixed JSON paths read on every project. They return "" (or {}
+# for a missing key) instead of raising when a field isn't the expected dict.
+
+get_dr_number = compile_json_path("value", "summary", "dodgeReportNumber")
+get_project_name = compile_json_path("projectName", "value")
+get_project_notes = compile_json_path("notes", "notes")
+get_project_address = compile_json_path("locations", "projectAddress")
+get_address_line1 = compile_json_path("addressLines", "line1", "value")
+get_address_city = compile_json_path("city", "value")
+get_address_state = compile_json_path("stateID", "value")
+get_address_zip5 = compile_json_path("zipCode5", "value")
+get_address_country = compile_json_path("countryID", "value")
+
+
+# Output column order for the CRM import file
+
+CSV_HEADERS = [
+    "Current_Opportunity_Phase",
+    "Name",
+    "Opportunity_Street",
+    "Opportunity_City",
+    "Opportunity_State",
+    "Opportunity_Postal_Code",
+    "Opportunity_Country",
+    "Market_Segment_Code",
+    "Opportunity_Type",
+    "Opportunity_Description",
+    "Company",
+    "Account_Information_Phone",
+    "Account_Information_Web_Site",
+    "Account_Information_Fax",
+    "Account_Information_Longitude",
+    "Account_Information_Latitude",
+    "Account_Information_Street",
+    "Customer_Information_City",
+    "Customer_Information_State",
+    "Account_Information_County",
+    "Account_Information_Postal_Code",
+    "Customer_Information_Country",
+    "Contact_Information_Job_Title",
+    "Contact_Information_EMail",
+    "Contact_Information_Phone",
+    "Start_Date",
+    "End_Date",
+    "Main_Contact_Person_First_name",
+    "Main_Contact_Person_Last_name",
+    "CRM_Field_1",
+    "CRM_Field_2",
+    "CRM_Field_3",
+    "CRM_Field_4",
+    "CRM_Field_5",
+    "CRM_Field_6",
+    "CRM_Field_7",
+]
+
+# Company/contact field values used when a project has no Owner contact
+
+EMPTY_OWNER_FIELDS = {
+    "Company": "",
+    "Account_Information_Phone": "",
+    "Account_Information_Web_Site": "",
+    "Account_Information_Fax": "",
+    "Account_Information_Longitude": "0.0000",
+    "Account_Information_Latitude": "0.0000",
+    "Account_Information_Street": "",
+    "Customer_Information_City": "",
+    "Customer_Information_State": "",
+    "Account_Information_County": "",
+    "Account_Information_Postal_Code": "",
+    "Customer_Information_Country": "",
+    "Contact_Information_Job_Title": "",
+    "Main_Contact_Person_First_name": "",
+    "Main_Contact_Person_Last_name": "",
+    "Contact_Information_EMail": "",
+    "Contact_Information_Phone": "",
+}
+
+# CRM-specific constant fields added to every row
+
+CRM_CONSTANT_FIELDS = {
+    "CRM_Field_1": "YOUR_VALUE_1",
+    "CRM_Field_2": "YOUR_VALUE_2",
+    "CRM_Field_3": "YOUR_VALUE_3",
+    "CRM_Field_4": "YOUR_VALUE_4",
+    "CRM_Field_5": "YOUR_VALUE_5",
+    "CRM_Field_6": "YOUR_VALUE_6",
+    "CRM_Field_7": "YOUR_VALUE_7",
+}
+
+# Columns that are always produced clean (country codes, ISO dates, constants)
+# and so skip clean_text
+
+PRECLEANED_FIELDS = frozenset({
+    "Opportunity_Country",
+    "Customer_Information_Country",
+    "Start_Date",
+    "End_Date",
+    *CRM_CONSTANT_FIELDS,
+})
 
 
 #####  API FUNCTIONS #####
 
 
+def get_included_correlations(correlations):
+    
+    """
+    Filter correlations down to the project types marked Include='Y'
+
+    Args:
+        correlations: The property type correlation dict from Excel
+
+    Returns:
+        Dict of project type -> correlation data for included types only
+    """
+    
+    return {
+        project_type: corr_data
+        for project_type, corr_data in correlations.items()
+        if corr_data.get("include") == "Y"
+    }
+
+
+def fetch_search_page(session, url, headers, search_request, offset):
+    
+    """
+    Fetch one page of Dodge API search results
+
+    Args:
+        session: requests.Session to send the request on
+        url: Project search endpoint URL
+        headers: Request headers including the API key
+        search_request: Search request body (criteria)
+        offset: Record offset of the page to fetch
+
+    Returns:
+        Parsed JSON response dict
+    """
+    
+    page_request = dict(search_request)
+    page_request["pagination"] = {"offset": offset, "limit": DODGE_API_PAGE_SIZE}
+    
+    response = session.post(url, headers=headers, json=page_request, timeout=DODGE_API_TIMEOUT)
+    response.raise_for_status()
+    
+    return orjson.loads(response.content)
+
+
 def search_dodge_api(correlations, days_back=2):
     
     """
     Search Dodge API for projects
 
+    All included project types go in one search request, so there is no
+    per-type loop to parallelize; the result pages are fetched concurrently.
+
     Args:
         correlations: The property type correlation dict from Excel
         days_back: How many days back to search (default 2)
 
     Returns:
         List of project dictionaries from API
+
+    Raises:
+        The request error if a result page after the first fails
     """
     
     # Extract project types where Include='Y'
     
-    included_types = []
-    
-    for project_type, corr_data in correlations.items():
-        if corr_data.get("include") == "Y":
-            included_types.append(project_type)
+    included_types = list(get_included_correlations(correlations))
     
     logging.info(f"Searching for {len(included_types)} project types")
     
@@ -55,7 +235,6 @@ def search_dodge_api(correlations, days_back=2):
             "projectTypes": included_types,
             "publishDateRange": {"min": date_min, "max": date_max},
         },
-        "pagination": {"offset": 0, "limit": 100},
     }
     
     # Get API key and make request
@@ -71,22 +250,20 @@ def search_dodge_api(correlations, days_back=2):
     url = f"{DODGE_API_BASE_URL}/project/search"
     
     try:
-        response = requests.post(url, headers=headers, json=search_request)
-        response.raise_for_status()
+        # First page tells us how many results there are
         
-        result = response.json()
+        result = fetch_search_page(_session, url, headers, search_request, 0)
         projects = result.get("projects", [])
         total = result.get("total", 0)
         
-        logging.info(f"Retrieved {len(projects)} projects (total available: {total})")
+        num_pages = math.ceil(total / DODGE_API_PAGE_SIZE)
         
-        if total > 100:
+        if num_pages > DODGE_API_MAX_PAGES:
             logging.warning(
-                f"More than 100 projects available ({total}), but only retrieved first 100 due to API limit"
+                f"{total} projects available, but only retrieving the first {DODGE_API_MAX_PAGES} pages"
             )
+            num_pages = DODGE_API_MAX_PAGES
         
-        return projects
-    
     except requests.exceptions.HTTPError as e:
         logging.error(f"Error calling Dodge API: {e}")
         logging.error(f"Response content: {e.response.text}")
@@ -95,6 +272,270 @@ def search_dodge_api(correlations, days_back=2):
     except Exception as e:
         logging.error(f"Error calling Dodge API: {e}")
         return []
+    
+    # Fetch remaining pages concurrently, keeping results in page order. A failed
+    # page fails the search: a short list would be recorded as a successful run
+    # and the missing projects could leave the search window unprocessed.
+    
+    offsets = [page * DODGE_API_PAGE_SIZE for page in range(1, num_pages)]
+    
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(DODGE_API_MAX_WORKERS, len(offsets))) as executor:
+            futures = [
+                executor.submit(fetch_search_page, _session, url, headers, search_request, offset)
+                for offset in offsets
+            ]
+            
+            for offset, future in zip(offsets, futures):
+                try:
+                    projects.extend(future.result().get("projects", []))
+                except Exception as e:
+                    logging.error(f"Error retrieving projects at offset {offset}: {e}")
+                    
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+    
+    logging.info(f"Retrieved {len(projects)} projects (total available: {total})")
+    
+    return projects
+
+
+def transform_project(project, dr_number, correlations, included_correlations):
+    
+    """
+    Map one API project to a CRM data row
+
+    Args:
+        project: Project JSON object from the API
+        dr_number: The project's DRNumber (for logging)
+        correlations: Property type correlations from Excel
+        included_correlations: Correlations limited to Include='Y' types
+
+    Returns:
+        Dict of CRM field -> value, or None if the project type is excluded or unknown
+    """
+    
+    # Extract primary project type from types array
+    
+    data = (project.get("value") or {}).get("data") or {}
+    types_array = data.get("types", [])
+    
+    primary_type = next(
+        (t.get("value", "") for t in types_array if t.get("primary") == "Y"), ""
+    )
+    
+    if not primary_type:
+        logging.warning(f"Project has no primary type; Project: {dr_number}")
+    
+    # Check property type correlation (only included types are kept)
+    
+    corr_data = included_correlations.get(primary_type) if primary_type else None
+    
+    if corr_data is None:
+        
+        # Excluded type, or type not in Excel - skip by default
+        
+        if primary_type:
+            reason = "excluded" if primary_type in correlations else "unknown"
+            logging.info(f"Skipping project ({reason} type): {primary_type}")
+        return None
+    
+    # Initialize CRM data row
+    
+    crm_data = {}
+    
+## --- GROUP: Basic Project Info --- ##
+    
+    # Current_Opportunity_Phase (from stages array)
+    
+    stages_array = data.get("stages", [])
+    
+    primary_stage = next(
+        (s.get("value", "") for s in stages_array if s.get("primary") == "Y"), ""
+    )
+    
+    crm_data["Current_Opportunity_Phase"] = primary_stage
+    
+    # Name (ProjectTitle)
+    
+    crm_data["Name"] = get_project_name(data) or ""
+    
+    # Opportunity_Type (PrimaryProjectType)
+    
+    crm_data["Opportunity_Type"] = primary_type
+    
+    # Market_Segment_Code (MarketSegment)
+    
+    crm_data["Market_Segment_Code"] = ""
+    
+    # Opportunity_Description (ProjectNote)
+    
+    crm_data["Opportunity_Description"] = get_project_notes(data) or ""
+    
+## --- GROUP: Project Address --- ##
+    
+    project_address = get_project_address(data)
+    
+    # Opportunity_Street (Address)
+    
+    crm_data["Opportunity_Street"] = get_address_line1(project_address) or ""
+    
+    # Opportunity_City (City)
+    
+    crm_data["Opportunity_City"] = get_address_city(project_address) or ""
+    
+    # Opportunity_State (State)
+    
+    crm_data["Opportunity_State"] = get_address_state(project_address) or ""
+    
+    # Opportunity_Postal_Code (Zip)
+    
+    zip5 = get_address_zip5(project_address) or ""
+    crm_data["Opportunity_Postal_Code"] = format_zip_code(zip5)
+    
+    # Opportunity_Country (Country) - with conversion
+    
+    country = get_address_country(project_address) or ""
+    crm_data["Opportunity_Country"] = get_country_code(country)
+    
+## --- GROUP: Project Dates --- ##
+    
+    additional_details = data.get("additionalDetails") or {}
+    
+    # Start_Date (TargetStartDate)
+   
+    crm_data["Start_Date"] = format_date_to_iso(additional_details.get("targetStartDate"))
+    
+    # End_Date (TargetCompletionDate)
+    
+    crm_data["End_Date"] = format_date_to_iso(additional_details.get("targetFinishDate"))
+    
+    # --- FIND OWNER CONTACT ---
+    
+    owner = get_owner_contact(project)
+    
+    if owner:
+        
+        ## --- GROUP: Owner Company Info --- ##
+        
+        # Company (CompanyName)
+       
+        crm_data["Company"] = owner.get("firmName", "")
+        
+        # Account_Information_Phone (CompanyTelephone)
+        
+        crm_data["Account_Information_Phone"] = format_phone(
+            owner.get("phoneAreaCode", ""), owner.get("phoneNumber", "")
+        )
+        
+        # Account_Information_Web_Site (CompanyWebsite)
+       
+        crm_data["Account_Information_Web_Site"] = owner.get("url", "")
+        
+        # Account_Information_Fax (CompanyFax)
+       
+        crm_data["Account_Information_Fax"] = format_phone(
+            owner.get("faxAreaCode", ""), owner.get("faxNumber", "")
+        )
+        
+        # Account_Information_Longitude
+        
+        project_geo = data.get("geo", {})
+        longitude = project_geo.get("longitude", "") if project_geo else ""
+        crm_data["Account_Information_Longitude"] = (
+            longitude if longitude else "0.0000"
+        )
+        
+        # Account_Information_Latitude (from project geo, not owner)
+        
+        latitude = project_geo.get("latitude", "") if project_geo else ""
+        crm_data["Account_Information_Latitude"] = (
+            latitude if latitude else "0.0000"
+        )
+        
+# --- GROUP: Owner Company Address ---
+        
+        # Account_Information_Street (CompanyAddress)
+        
+        address_lines = owner.get("addressLines", {})
+        crm_data["Account_Information_Street"] = address_lines.get("line1", "")
+        
+        # Customer_Information_City (CompanyCity)
+        
+        crm_data["Customer_Information_City"] = owner.get("city", "")
+        
+        # Customer_Information_State (CompanyState)
+        
+        crm_data["Customer_Information_State"] = owner.get("state", "")
+        
+        # Account_Information_County (CompanyCounty)
+        
+        crm_data["Account_Information_County"] = owner.get("county", "")
+        
+        # Account_Information_Postal_Code (CompanyZip)
+        
+        crm_data["Account_Information_Postal_Code"] = format_zip_code(
+            owner.get("zipCode5", "")
+        )
+        
+        # Customer_Information_Country (CompanyCountry) - with conversion
+        
+        owner_country = owner.get("country", "")
+        crm_data["Customer_Information_Country"] = get_country_code(
+            owner_country
+        )
+        
+## --- GROUP: Owner Contact Person --- ##
+        
+        # Contact_Information_Job_Title (ContactTitle)
+       
+        crm_data["Contact_Information_Job_Title"] = owner.get(
+            "contactTitle", ""
+        )
+        
+        # Split contact name into first and last
+        
+        contact_name = owner.get("contactName", "")
+        
+        if contact_name:
+            name_parts = contact_name.strip().split(
+                None, 1
+            )  # Split on first space
+            crm_data["Main_Contact_Person_First_name"] = (
+                name_parts[0] if len(name_parts) > 0 else ""
+            )
+            crm_data["Main_Contact_Person_Last_name"] = (
+                name_parts[1] if len(name_parts) > 1 else ""
+            )
+        else:
+            crm_data["Main_Contact_Person_First_name"] = ""
+            crm_data["Main_Contact_Person_Last_name"] = ""
+        
+        # Contact_Information_EMail (ContactEmail)
+       
+        crm_data["Contact_Information_EMail"] = owner.get("email", "")
+        
+        # Contact_Information_Phone (ContactPhone)
+        
+        crm_data["Contact_Information_Phone"] = format_phone(
+            owner.get("phoneAreaCode", ""), owner.get("phoneNumber", "")
+        )
+    
+    else:
+        # No owner found - set all company/contact fields to empty
+        
+        crm_data.update(EMPTY_OWNER_FIELDS)
+    
+    ## --- PROPERTY TYPE CORRELATION FIELDS --- ##
+    
+    crm_data["Market_Segment_Code"] = corr_data.get("segment_code", "")
+    
+    ## --- CRM-SPECIFIC FIELDS --- ##
+    
+    crm_data.update(CRM_CONSTANT_FIELDS)
+    
+    return crm_data
 
 
 def process_api_projects(projects, correlations, processed_dr_numbers, output_folder):
@@ -114,400 +555,78 @@ def process_api_projects(projects, correlations, processed_dr_numbers, output_fo
     
     logging.info(f"Processing {len(projects)} projects from API...")
     
-    csv_rows = []
-    duplicates_skipped = 0
+    # Fix the output file timestamp for this run
+    
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    
+    # Output rows in CSV_HEADERS order, with a flag for fields needing clean_text
+    
+    row_fields = [(header, header not in PRECLEANED_FIELDS) for header in CSV_HEADERS]
+    rows = []
     new_dr_numbers = set()
+    included_correlations = get_included_correlations(correlations)
     
     try:
-        for project in projects:
-            
-            # Extract DRNumber for duplicate detection
-            
-            dr_number = get_json_value(project, "value", "summary", "dodgeReportNumber")
-            
-            if dr_number:
-                if dr_number in processed_dr_numbers:
-                    logging.info(f"Skipping duplicate DRNumber: {dr_number}")
-                    duplicates_skipped += 1
-                    continue
-            
-            # Extract primary project type from types array
-            
-            data = project.get("value", {}).get("data", {})
-            types_array = data.get("types", [])
-            
-            primary_type = ""
-            for type_item in types_array:
-                if type_item.get("primary") == "Y":
-                    primary_type = type_item.get("value", "")
-                    break
+        # Make sure the output folder exists (tmp dirs are ephemeral on cold instances)
+        
+        os.makedirs(output_folder, exist_ok=True)
+        
+        # Find already processed DRNumbers with one set difference; projects
+        # without a DRNumber are always kept
+        
+        dr_numbers = [str(dr) if dr else "" for dr in map(get_dr_number, projects)]
+        unprocessed = set(dr_numbers).difference(processed_dr_numbers)
+        unprocessed.add("")
+        
+        kept = [
+            (project, dr_number)
+            for project, dr_number in zip(projects, dr_numbers)
+            if dr_number in unprocessed
+        ]
+        duplicates_skipped = len(projects) - len(kept)
+        
+        for project, dr_number in kept:
             
-            if not primary_type:
-                logging.warning(f"Project has no primary type; Project: {dr_number}")
+            # Map project to CRM fields (None if its type is not included)
             
-            # Check property type correlation
+            crm_data = transform_project(project, dr_number, correlations, included_correlations)
             
-            if primary_type and primary_type in correlations:
-                corr_data = correlations[primary_type]
-                
-                # Check if this project type should be included
-               
-                if corr_data.get("include", "N") != "Y":
-                    logging.info(f"Skipping project (excluded type): {primary_type}")
-                    continue
-            else:
-               
-                # Project type not in Excel - skip by default
-                
-                if primary_type:
-                    logging.info(f"Skipping project (unknown type): {primary_type}")
+            if crm_data is None:
                 continue
             
-            # Initialize CRM data row
-            
-            crm_data = {}
-            
-## --- GROUP: Basic Project Info --- ##
-            
-            # Current_Opportunity_Phase (from stages array)
-            
-            stages_array = data.get("stages", [])
-            
-            primary_stage = ""
-            for stage_item in stages_array:
-                if stage_item.get("primary") == "Y":
-                    primary_stage = stage_item.get("value", "")
-                    break
-            
-            crm_data["Current_Opportunity_Phase"] = primary_stage
-            
-            # Name (ProjectTitle)
-            
-            crm_data["Name"] = get_json_value(
-                project, "value", "data", "projectName", "value"
-            )
-            
-            # Opportunity_Type (PrimaryProjectType)
-            
-            crm_data["Opportunity_Type"] = primary_type
-            
-            # Market_Segment_Code (MarketSegment)
-            
-            crm_data["Market_Segment_Code"] = ""
-            
-            # Opportunity_Description (ProjectNote)
-            
-            crm_data["Opportunity_Description"] = (
-                project.get("value", {})
-                .get("data", {})
-                .get("notes", {})
-                .get("notes", "")
-            )
-            
-## --- GROUP: Project Address --- ##
-            
-            # Opportunity_Street (Address)
-            
-            crm_data["Opportunity_Street"] = get_json_value(
-                project,
-                "value",
-                "data",
-                "locations",
-                "projectAddress",
-                "addressLines",
-                "line1",
-                "value",
-            )
-            
-            # Opportunity_City (City)
-            
-            crm_data["Opportunity_City"] = get_json_value(
-                project, "value", "data", "locations", "projectAddress", "city", "value"
-            )
-            
-            # Opportunity_State (State)
-            
-            crm_data["Opportunity_State"] = get_json_value(
-                project,
-                "value",
-                "data",
-                "locations",
-                "projectAddress",
-                "stateID",
-                "value",
-            )
-            
-            # Opportunity_Postal_Code (Zip)
-            
-            zip5 = get_json_value(
-                project,
-                "value",
-                "data",
-                "locations",
-                "projectAddress",
-                "zipCode5",
-                "value",
-            )
-            crm_data["Opportunity_Postal_Code"] = str(zip5).zfill(5) if zip5 else ""
-            
-            # Opportunity_Country (Country) - with conversion
-            
-            country = get_json_value(
-                project,
-                "value",
-                "data",
-                "locations",
-                "projectAddress",
-                "countryID",
-                "value",
-            )
-            crm_data["Opportunity_Country"] = get_country_code(country)
-            
-## --- GROUP: Project Dates --- ##
-            
-            # Start_Date (TargetStartDate)
-           
-            start_date_raw = get_json_value(
-                project,
-                "value",
-                "data",
-                "additionalDetails",
-                "targetStartDate",
-                "value",
-            )
-            crm_data["Start_Date"] = format_date_to_iso(start_date_raw)
-            
-            # End_Date (TargetCompletionDate)
-            
-            end_date_raw = get_json_value(
-                project,
-                "value",
-                "data",
-                "additionalDetails",
-                "targetFinishDate",
-                "value",
-            )
-            crm_data["End_Date"] = format_date_to_iso(end_date_raw)
-            
-            # --- FIND OWNER CONTACT ---
-            
-            owner = get_owner_contact(project)
-            
-            if owner:
-                
-                ## --- GROUP: Owner Company Info --- ##
-                
-                # Company (CompanyName)
-               
-                crm_data["Company"] = owner.get("firmName", "")
-                
-                # Account_Information_Phone (CompanyTelephone)
-                
-                crm_data["Account_Information_Phone"] = format_phone(
-                    owner.get("phoneAreaCode", ""), owner.get("phoneNumber", "")
-                )
-                
-                # Account_Information_Web_Site (CompanyWebsite)
-               
-                crm_data["Account_Information_Web_Site"] = owner.get("url", "")
-                
-                # Account_Information_Fax (CompanyFax)
-               
-                crm_data["Account_Information_Fax"] = format_phone(
-                    owner.get("faxAreaCode", ""), owner.get("faxNumber", "")
-                )
-                
-                # Account_Information_Longitude
-                
-                project_geo = data.get("geo", {})
-                longitude = project_geo.get("longitude", "") if project_geo else ""
-                crm_data["Account_Information_Longitude"] = (
-                    longitude if longitude else "0.0000"
-                )
-                
-                # Account_Information_Latitude (from project geo, not owner)
-                
-                latitude = project_geo.get("latitude", "") if project_geo else ""
-                crm_data["Account_Information_Latitude"] = (
-                    latitude if latitude else "0.0000"
-                )
-                
-# --- GROUP: Owner Company Address ---
-                
-                # Account_Information_Street (CompanyAddress)
-                
-                address_lines = owner.get("addressLines", {})
-                crm_data["Account_Information_Street"] = address_lines.get("line1", "")
-                
-                # Customer_Information_City (CompanyCity)
-                
-                crm_data["Customer_Information_City"] = owner.get("city", "")
-                
-                # Customer_Information_State (CompanyState)
-                
-                crm_data["Customer_Information_State"] = owner.get("state", "")
-                
-                # Account_Information_County (CompanyCounty)
-                
-                crm_data["Account_Information_County"] = owner.get("county", "")
-                
-                # Account_Information_Postal_Code (CompanyZip)
-                
-                zip5 = owner.get("zipCode5", "")
-                crm_data["Account_Information_Postal_Code"] = (
-                    str(zip5).zfill(5) if zip5 else ""
-                )
-                
-                # Customer_Information_Country (CompanyCountry) - with conversion
-                
-                owner_country = owner.get("country", "")
-                crm_data["Customer_Information_Country"] = get_country_code(
-                    owner_country
-                )
-                
-## --- GROUP: Owner Contact Person --- ##
-                
-                # Contact_Information_Job_Title (ContactTitle)
-               
-                crm_data["Contact_Information_Job_Title"] = owner.get(
-                    "contactTitle", ""
-                )
-                
-                # Split contact name into first and last
-                
-                contact_name = owner.get("contactName", "")
-                
-                if contact_name:
-                    name_parts = contact_name.strip().split(
-                        None, 1
-                    )  # Split on first space
-                    crm_data["Main_Contact_Person_First_name"] = (
-                        name_parts[0] if len(name_parts) > 0 else ""
-                    )
-                    crm_data["Main_Contact_Person_Last_name"] = (
-                        name_parts[1] if len(name_parts) > 1 else ""
-                    )
-                else:
-                    crm_data["Main_Contact_Person_First_name"] = ""
-                    crm_data["Main_Contact_Person_Last_name"] = ""
-                
-                # Contact_Information_EMail (ContactEmail)
-               
-                crm_data["Contact_Information_EMail"] = owner.get("email", "")
-                
-                # Contact_Information_Phone (ContactPhone)
-                
-                crm_data["Contact_Information_Phone"] = format_phone(
-                    owner.get("phoneAreaCode", ""), owner.get("phoneNumber", "")
-                )
-            
-            else:
-                # No owner found - set all company/contact fields to empty
-                
-                crm_data["Company"] = ""
-                crm_data["Account_Information_Phone"] = ""
-                crm_data["Account_Information_Web_Site"] = ""
-                crm_data["Account_Information_Fax"] = ""
-                crm_data["Account_Information_Longitude"] = "0.0000"
-                crm_data["Account_Information_Latitude"] = "0.0000"
-                crm_data["Account_Information_Street"] = ""
-                crm_data["Customer_Information_City"] = ""
-                crm_data["Customer_Information_State"] = ""
-                crm_data["Account_Information_County"] = ""
-                crm_data["Account_Information_Postal_Code"] = ""
-                crm_data["Customer_Information_Country"] = ""
-                crm_data["Contact_Information_Job_Title"] = ""
-                crm_data["Main_Contact_Person_First_name"] = ""
-                crm_data["Main_Contact_Person_Last_name"] = ""
-                crm_data["Contact_Information_EMail"] = ""
-                crm_data["Contact_Information_Phone"] = ""
-            
-            ## --- PROPERTY TYPE CORRELATION FIELDS --- ##
-            
-            crm_data["Market_Segment_Code"] = corr_data.get("segment_code", "")
-            
-            ## --- CRM-SPECIFIC FIELDS --- ##
-            
-            crm_data["CRM_Field_1"] = "YOUR_VALUE_1"
-            crm_data["CRM_Field_2"] = "YOUR_VALUE_2"
-            crm_data["CRM_Field_3"] = "YOUR_VALUE_3"
-            crm_data["CRM_Field_4"] = "YOUR_VALUE_4"
-            crm_data["CRM_Field_5"] = "YOUR_VALUE_5"
-            crm_data["CRM_Field_6"] = "YOUR_VALUE_6"
-            crm_data["CRM_Field_7"] = "YOUR_VALUE_7"
-            
             # Add DR number to tracking once project passes validation
             
             if dr_number:
                 new_dr_numbers.add(dr_number)
             
-            # Clean all text values before adding to output
+            # Clean free-text values while building the output row
             
-            for key in crm_data:
-                crm_data[key] = clean_text(crm_data[key])
+            row = []
             
-            # Add to CSV rows
+            for header, needs_cleaning in row_fields:
+                value = crm_data[header]
+                row.append(clean_text(value) if needs_cleaning and value else value)
             
-            csv_rows.append(crm_data)
+            rows.append(row)
         
         # Only create CSV if there are projects
         
-        if len(csv_rows) > 0:
+        if rows:
             
             # Create output filename with timestamp
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"processed_api_{timestamp}.xlsx"
+            output_filename = f"processed_api_{timestamp}.csv"
             output_path = os.path.join(output_folder, output_filename)
             
-            # Define CSV headers in order
-            
-            csv_headers = [
-                "Current_Opportunity_Phase",
-                "Name",
-                "Opportunity_Street",
-                "Opportunity_City",
-                "Opportunity_State",
-                "Opportunity_Postal_Code",
-                "Opportunity_Country",
-                "Market_Segment_Code",
-                "Opportunity_Type",
-                "Opportunity_Description",
-                "Company",
-                "Account_Information_Phone",
-                "Account_Information_Web_Site",
-                "Account_Information_Fax",
-                "Account_Information_Longitude",
-                "Account_Information_Latitude",
-                "Account_Information_Street",
-                "Customer_Information_City",
-                "Customer_Information_State",
-                "Account_Information_County",
-                "Account_Information_Postal_Code",
-                "Customer_Information_Country",
-                "Contact_Information_Job_Title",
-                "Contact_Information_EMail",
-                "Contact_Information_Phone",
-                "Start_Date",
-                "End_Date",
-                "Main_Contact_Person_First_name",
-                "Main_Contact_Person_Last_name",
-                "CRM_Field_1",
-                "CRM_Field_2",
-                "CRM_Field_3",
-                "CRM_Field_4",
-                "CRM_Field_5",
-                "CRM_Field_6",
-                "CRM_Field_7",
-            ]
-            
-            # Write Excel file
+            # Write CSV file
             
-            df = pd.DataFrame(csv_rows, columns=csv_headers)
-            df.to_excel(output_path, index=False)
+            with open(output_path, "w", newline="", buffering=1024 * 1024) as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(CSV_HEADERS)
+                writer.writerows(rows)
             
             logging.info(f"Created {output_filename}")
-            logging.info(f"   - {len(csv_rows)} unique projects processed")
+            logging.info(f"   - {len(rows)} unique projects processed")
             
             if duplicates_skipped > 0:
                 logging.info(f"   - {duplicates_skipped} duplicates skipped")
@@ -515,14 +634,14 @@ def process_api_projects(projects, correlations, processed_dr_numbers, output_fo
             return (
                 True,
                 output_path,
-                len(csv_rows),
+                len(rows),
                 duplicates_skipped,
                 new_dr_numbers,
                 None,
             )
         
         else:
-            logging.info("No unique projects found to process")
+            logging.info(f"No unique projects found to process ({duplicates_skipped} duplicates skipped)")
             return True, None, 0, duplicates_skipped, new_dr_numbers, None
     
     except Exception as e:
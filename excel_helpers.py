@@ -16,33 +16,44 @@ def read_property_type_correlation(excel_file):
     # Read the PropertyType-coorelation sheet
     df = pd.read_excel(excel_file, sheet_name="PropertyType-correlation")
     
-    correlations = {}
-    
-    for index, row in df.iterrows():
-        
-        # The project type is in the "Dodge - Sub section" column
-        project_type = row["Dodge - Sub section"]
-        industry = row["CRM - Industry"]
-        industry_code = row["CRM - Industry Code"]
-        segment = row["CRM - Segment "]
-        segment_code = row["CRM - Segment Code"]
-        include = row.get("Include", "N")  # Read Include column
-        
-        # Skip empty rows
-        if pd.isna(project_type):
-            continue
-        
-        # Clean up the project type name
-        project_type = str(project_type).strip()
-        
-        # Store the correlation data
-        correlations[project_type] = {
-            "industry": industry if not pd.isna(industry) else "",
-            "industry_code": str(industry_code) if not pd.isna(industry_code) else "",
-            "segment": segment if not pd.isna(segment) else "",
-            "segment_code": segment_code if not pd.isna(segment_code) else "",
-            "include": str(include).strip().upper() if not pd.isna(include) else "N",
+    # Skip empty rows and clean up the project type names
+    
+    df = df.dropna(subset=["Dodge - Sub section"])
+    
+    # Read Include column (defaults to "N" when the sheet has none)
+    
+    include_column = df["Include"] if "Include" in df.columns else pd.Series("N", index=df.index)
+    
+    project_types = df["Dodge - Sub section"].astype(str).str.strip()
+    industries = df["CRM - Industry"].astype(object).fillna("")
+    industry_codes = (
+        df["CRM - Industry Code"].astype(str).where(df["CRM - Industry Code"].notna(), "")
+    )
+    segments = df["CRM - Segment "].astype(object).fillna("")
+    segment_codes = df["CRM - Segment Code"].astype(object).fillna("")
+    includes = (
+        include_column.astype(str).str.strip().str.upper().where(include_column.notna(), "N")
+    )
+    
+    # Build the correlation data in one pass over the columns
+    
+    correlations = {
+        project_type: {
+            "industry": industry,
+            "industry_code": industry_code,
+            "segment": segment,
+            "segment_code": segment_code,
+            "include": include,
         }
+        for project_type, industry, industry_code, segment, segment_code, include in zip(
+            project_types.to_numpy(),
+            industries.to_numpy(),
+            industry_codes.to_numpy(),
+            segments.to_numpy(),
+            segment_codes.to_numpy(),
+            includes.to_numpy(),
+        )
+    }
     
     logging.info(f"Found {len(correlations)} property type correlations")
     
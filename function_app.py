@@ -2,17 +2,30 @@
 
 import logging
 import os
+import time
 import azure.functions as func
-from datetime import datetime
-from excel_helpers import read_property_type_correlation
-from sharepoint_helpers import download_file_from_sharepoint
-from blob_helpers import upload_csv_to_blob
-from tracking import load_processed_files_log, save_processed_files_log
-from dodge_api import search_dodge_api, process_api_projects
+from datetime import datetime, timezone
+
+# Heavier helper modules (pandas, Azure SDKs, requests) are imported inside the
+# functions that use them to keep worker cold start short
 
 
 app = func.FunctionApp()
 
+# Separator line framing the start/summary log messages
+
+BANNER = "=" * 60
+
+# Property type correlations from the last Excel parse, keyed by the file's
+# modification time so warm invocations skip re-reading an unchanged workbook
+
+_CORR_CACHE = {"mtime": None, "data": None}
+
+# Tracking data loaded by the last invocation on this worker. process_api_run
+# updates it in place, so it stays current while SharePoint reports no change
+
+_TRACKING_CACHE = {"data": None}
+
 
 ##### CONFIG/SETUP HELPER #####
 
@@ -21,6 +34,15 @@ def load_processor_config(excel_file="dodgeMapping.xlsx"):
     
     """Load all configuration needed for API processing"""
     
+    from excel_helpers import read_property_type_correlation
+    from sharepoint_helpers import download_file_from_sharepoint
+    from tracking import (
+        DR_NUMBERS_FILE,
+        get_dr_numbers_file,
+        mark_file_synced,
+        load_processed_files_log,
+    )
+    
     output_folder = "/tmp/processed_csv_files"
     os.makedirs(output_folder, exist_ok=True)
     
@@ -32,32 +54,77 @@ def load_processor_config(excel_file="dodgeMapping.xlsx"):
    
     download_response = download_file_from_sharepoint(
         
-        "processed_files.json/processed_files.json"
+        "processed_files.json/processed_files.json", log_file
     )
     
     if download_response.status_code == 200:
-        with open(log_file, "wb") as f:
-            f.write(download_response.content)
+        mark_file_synced(log_file)
         logging.info("Downloaded existing tracking file from SharePoint")
+    elif download_response.status_code == 304:
+        logging.info("Tracking file unchanged on SharePoint - using local copy")
+    elif download_response.status_code != 404:
+        
+        # Running without the tracking state would resend processed leads
+        # and then overwrite the SharePoint copy with this run's data only
+        
+        logging.error(
+            "Failed to download tracking file: %s - aborting", download_response.status_code
+        )
+        return None, None, None
+    
+    # Download the compact DRNumber file that accompanies it
     
-    # Load tracking file
-  
-    processed_data = load_processed_files_log(log_file)
+    dr_numbers_response = download_file_from_sharepoint(
+        f"processed_files.json/{DR_NUMBERS_FILE}", get_dr_numbers_file(log_file)
+    )
+    
+    if dr_numbers_response.status_code == 200:
+        mark_file_synced(get_dr_numbers_file(log_file))
+        logging.info("Downloaded existing DRNumber file from SharePoint")
+    elif dr_numbers_response.status_code == 304:
+        logging.info("DRNumber file unchanged on SharePoint - using local copy")
+    elif dr_numbers_response.status_code != 404:
+        logging.error(
+            "Failed to download DRNumber file: %s - aborting", dr_numbers_response.status_code
+        )
+        return None, None, None
+    
+    # Load tracking file, unless neither file changed since this worker last had it
+    
+    tracking_unchanged = (
+        download_response.status_code == 304
+        and dr_numbers_response.status_code in (304, 404)
+    )
+    
+    if tracking_unchanged and _TRACKING_CACHE["data"] is not None:
+        processed_data = _TRACKING_CACHE["data"]
+        logging.info("Reusing tracking data from previous invocation")
+    else:
+        processed_data = load_processed_files_log(log_file)
+        _TRACKING_CACHE["data"] = processed_data
     
-    logging.info(f"Loaded {len(processed_data.get('api_runs', {}))} previous API runs")
     logging.info(
-        f"Loaded {len(processed_data.get('processed_dr_numbers', set()))} processed DRNumbers"
+        "Loaded %d previous API runs, %d processed DRNumbers",
+        len(processed_data.get("api_runs", {})),
+        len(processed_data.get("processed_dr_numbers", set())),
     )
     
     # Load property type correlations only
    
     try:
-        correlations = read_property_type_correlation(excel_file)
+        excel_mtime = os.stat(excel_file).st_mtime
+        
+        if _CORR_CACHE["mtime"] == excel_mtime:
+            correlations = _CORR_CACHE["data"]
+        else:
+            correlations = read_property_type_correlation(excel_file)
+            _CORR_CACHE["mtime"] = excel_mtime
+            _CORR_CACHE["data"] = correlations
     except Exception as e:
-        logging.error(f"Error loading Excel file: {e}")
+        logging.error("Error loading Excel file: %s", e)
         return None, None, None
     
-    logging.info(f"Loaded {len(correlations)} property type correlations")
+    logging.info("Loaded %d property type correlations", len(correlations))
     
     return correlations, processed_data, log_file
 
@@ -79,12 +146,21 @@ def process_api_run(correlations, processed_data, log_file):
         None (updates processed_data in place)
     """
     
+    from blob_helpers import upload_csv_to_blob
+    from dodge_api import search_dodge_api, process_api_projects
+    from sharepoint_helpers import upload_file_to_sharepoint
+    from tracking import prune_api_runs, save_processed_files_log, sync_log_to_sharepoint
+    
     output_folder = "/tmp/processed_csv_files"
-    run_timestamp = datetime.now().isoformat()
     
-    logging.info("=" * 60)
-    logging.info(f"Starting API run at {run_timestamp}")
-    logging.info("=" * 60)
+    # Runs are keyed by nanosecond time so overlapping runs can't collide;
+    # the readable time is stored in each entry
+    
+    run_ns = time.time_ns()
+    run_key = str(run_ns)
+    run_timestamp = datetime.fromtimestamp(run_ns / 1e9, timezone.utc).isoformat()
+    
+    logging.info("%s\nStarting API run at %s\n%s", BANNER, run_timestamp, BANNER)
     
     try:
         # Search Dodge API for projects
@@ -96,7 +172,8 @@ def process_api_run(correlations, processed_data, log_file):
             
             # Log this run
            
-            processed_data["api_runs"][run_timestamp] = {
+            processed_data["api_runs"][run_key] = {
+                "timestamp": run_timestamp,
                 "status": "success",
                 "projects_found": 0,
                 "unique_projects": 0,
@@ -106,10 +183,9 @@ def process_api_run(correlations, processed_data, log_file):
                 "sharepoint_uploaded": False,
             }
             
-            save_processed_files_log(log_file, processed_data, "")
             return
         
-        logging.info(f"API returned {len(projects)} projects")
+        logging.info("API returned %d projects", len(projects))
         
         # Process projects into CSV
        
@@ -128,11 +204,12 @@ def process_api_run(correlations, processed_data, log_file):
         )
         
         if not success:
-            logging.error(f"Processing failed: {error_msg}")
+            logging.error("Processing failed: %s", error_msg)
             
             # Log failed run
             
-            processed_data["api_runs"][run_timestamp] = {
+            processed_data["api_runs"][run_key] = {
+                "timestamp": run_timestamp,
                 "status": "failed",
                 "error": error_msg,
                 "projects_found": len(projects),
@@ -143,7 +220,6 @@ def process_api_run(correlations, processed_data, log_file):
                 "sharepoint_uploaded": False,
             }
             
-            save_processed_files_log(log_file, processed_data, "")
             return
         
         if not output_path:
@@ -152,7 +228,8 @@ def process_api_run(correlations, processed_data, log_file):
             
             logging.info("No CSV output - no qualifying projects found")
             
-            processed_data["api_runs"][run_timestamp] = {
+            processed_data["api_runs"][run_key] = {
+                "timestamp": run_timestamp,
                 "status": "success",
                 "projects_found": len(projects),
                 "unique_projects": 0,
@@ -165,7 +242,6 @@ def process_api_run(correlations, processed_data, log_file):
             # Update DRNumbers even if no output
             
             processed_data["processed_dr_numbers"].update(new_dr_numbers)
-            save_processed_files_log(log_file, processed_data, "")
             return
         
         # Upload CSV to Blob Storage
@@ -173,9 +249,10 @@ def process_api_run(correlations, processed_data, log_file):
         blob_success = upload_csv_to_blob(output_path)
         
         if not blob_success:
-            logging.error(f"CRITICAL: Blob storage upload failed for {output_path}")
+            logging.error("CRITICAL: Blob storage upload failed for %s", output_path)
             
-            processed_data["api_runs"][run_timestamp] = {
+            processed_data["api_runs"][run_key] = {
+                "timestamp": run_timestamp,
                 "status": "failed",
                 "error": "Blob storage upload failed",
                 "projects_found": len(projects),
@@ -186,26 +263,25 @@ def process_api_run(correlations, processed_data, log_file):
                 "sharepoint_uploaded": False,
             }
             
-            save_processed_files_log(log_file, processed_data, "")
             return
         
-        logging.info(f"SUCCESS: Blob storage upload completed for {output_path}")
+        logging.info("SUCCESS: Blob storage upload completed for %s", output_path)
         
         # Upload CSV to SharePoint (optional/for records)
        
-        from sharepoint_helpers import upload_file_to_sharepoint
         sp_success = upload_file_to_sharepoint(output_path, "Processed")
         
         if sp_success:
-            logging.info(f"SharePoint upload completed for {output_path}")
+            logging.info("SharePoint upload completed for %s", output_path)
         else:
             logging.warning(
-                f"SharePoint upload failed for {output_path} - continuing anyway"
+                "SharePoint upload failed for %s - continuing anyway", output_path
             )
         
         # Log successful run
         
-        processed_data["api_runs"][run_timestamp] = {
+        processed_data["api_runs"][run_key] = {
+            "timestamp": run_timestamp,
             "status": "success",
             "projects_found": len(projects),
             "unique_projects": unique_count,
@@ -218,20 +294,26 @@ def process_api_run(correlations, processed_data, log_file):
         # Update DRNumbers
         
         processed_data["processed_dr_numbers"].update(new_dr_numbers)
-        save_processed_files_log(log_file, processed_data, "")
         
-        logging.info("=" * 60)
-        logging.info(f"API run completed successfully")
-        logging.info(f"  - Projects found: {len(projects)}")
-        logging.info(f"  - Unique processed: {unique_count}")
-        logging.info(f"  - Duplicates skipped: {duplicates_count}")
-        logging.info(f"  - CSV uploaded to Blob: {blob_success}")
-        logging.info("=" * 60)
+        logging.info(
+            "%s\nAPI run completed successfully\n"
+            "  - Projects found: %d\n"
+            "  - Unique processed: %d\n"
+            "  - Duplicates skipped: %d\n"
+            "  - CSV uploaded to Blob: %s\n%s",
+            BANNER,
+            len(projects),
+            unique_count,
+            duplicates_count,
+            blob_success,
+            BANNER,
+        )
     
     except Exception as e:
-        logging.error(f"Unexpected error in API run: {e}")
+        logging.error("Unexpected error in API run: %s", e)
         
-        processed_data["api_runs"][run_timestamp] = {
+        processed_data["api_runs"][run_key] = {
+            "timestamp": run_timestamp,
             "status": "failed",
             "error": f"Unexpected error: {str(e)}",
             "projects_found": 0,
@@ -241,8 +323,14 @@ def process_api_run(correlations, processed_data, log_file):
             "blob_uploaded": False,
             "sharepoint_uploaded": False,
         }
+    
+    finally:
+        # Save tracking state once per run, whichever way the run ended,
+        # keeping only the most recent API runs
         
-        save_processed_files_log(log_file, processed_data, "")
+        prune_api_runs(processed_data)
+        save_processed_files_log(log_file, processed_data)
+        sync_log_to_sharepoint(log_file)
 
 
 ##### MAIN TIMER FUNCTION #####
@@ -260,9 +348,7 @@ def dodge_timer_trigger(myTimer: func.TimerRequest) -> None:
     if myTimer.past_due:
         logging.info("The timer is past due!")
     
-    logging.info("=" * 60)
-    logging.info("Dodge API Timer Trigger - Starting")
-    logging.info("=" * 60)
+    logging.info("%s\nDodge API Timer Trigger - Starting\n%s", BANNER, BANNER)
     
     try:
         # Load configuration
@@ -282,5 +368,5 @@ def dodge_timer_trigger(myTimer: func.TimerRequest) -> None:
         logging.info("Dodge API Timer Trigger - Completed")
     
     except Exception as e:
-        logging.error(f"Fatal error in timer trigger: {e}")
+        logging.error("Fatal error in timer trigger: %s", e)
         raise
\ No newline at end of file
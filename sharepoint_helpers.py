@@ -3,9 +3,39 @@
 
 import logging
 import os
+import time
 import requests
 from azure.identity import DefaultAzureCredential
-from config import SITE_ID, LEADS_DRIVE_ID
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import SITE_ID, LEADS_DRIVE_ID, GRAPH_MAX_CONNECTIONS, GRAPH_MAX_RETRIES
+
+
+# Credential and keep-alive session shared by all Graph calls in this worker.
+# The pool is capped and throttled (429) or unavailable (503) responses are
+# retried after the Retry-After delay Graph sends back.
+
+_credential = DefaultAzureCredential()
+_token_cache = {"token": None, "expires_on": 0}
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=GRAPH_MAX_CONNECTIONS,
+        pool_block=True,
+        max_retries=Retry(
+            total=GRAPH_MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=[429, 503],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# ETag of each SharePoint file as last downloaded or uploaded, by file path
+
+_etags = {}
 
 
 ##### SHAREPOINT HELPERS #####
@@ -15,25 +45,72 @@ def get_graph_headers():
     
     """Get authorization headers for Graph API"""
     
-    credential = DefaultAzureCredential()
-    token = credential.get_token("https://graph.microsoft.com/.default")
+    # Reuse the cached token until it is within 60 seconds of expiring
+    
+    if time.time() >= _token_cache["expires_on"] - 60:
+        token = _credential.get_token("https://graph.microsoft.com/.default")
+        _token_cache["token"] = token.token
+        _token_cache["expires_on"] = token.expires_on
     
     return {
-        "Authorization": f"Bearer {token.token}",
+        "Authorization": f"Bearer {_token_cache['token']}",
         "Content-Type": "application/json",
     }
 
 
-def download_file_from_sharepoint(file_name):
+def remember_etag(file_name, response):
+    
+    """Record the ETag of an uploaded file from Graph's driveItem response"""
+    
+    try:
+        etag = response.json().get("eTag") or response.headers.get("ETag")
+    except ValueError:
+        etag = response.headers.get("ETag")
+    
+    if etag:
+        _etags[file_name] = etag
+    else:
+        _etags.pop(file_name, None)
+
+
+def download_file_from_sharepoint(file_name, dest_path=None):
    
-    """Download a file from SharePoint"""
+    """
+    Download a file from SharePoint, streaming it to dest_path if given
+
+    When dest_path already holds the last copy seen, the download is
+    conditional and a 304 response leaves the local file untouched.
+    """
     
     headers = get_graph_headers()
     headers.pop("Content-Type", None)
     
+    if dest_path is not None and file_name in _etags and os.path.exists(dest_path):
+        headers["If-None-Match"] = _etags[file_name]
+    
     download_url = f"https://graph.microsoft.com/v1.0/sites/{SITE_ID}/drives/{LEADS_DRIVE_ID}/root:/{file_name}:/content"
     
-    return requests.get(download_url, headers=headers)
+    if dest_path is None:
+        return _session.get(download_url, headers=headers)
+    
+    response = _session.get(download_url, headers=headers, stream=True)
+    
+    with response:
+        if response.status_code == 200:
+            
+            # Write to a temp file first so a dropped connection can't leave
+            # a truncated file in place of a good one
+            
+            temp_path = f"{dest_path}.part"
+            with open(temp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+            os.replace(temp_path, dest_path)
+            
+            if response.headers.get("ETag"):
+                _etags[file_name] = response.headers["ETag"]
+    
+    return response
 
 
 def upload_file_to_sharepoint(file_content, target_path, target_filename=None):
@@ -44,14 +121,9 @@ def upload_file_to_sharepoint(file_content, target_path, target_filename=None):
         headers = get_graph_headers()
         headers["Content-Type"] = "application/octet-stream"
         
-        # If file_content is a path, read the file
-        if isinstance(file_content, str):
-            with open(file_content, "rb") as f:
-                file_data = f.read()
-            if target_filename is None:
-                target_filename = os.path.basename(file_content)
-        else:
-            file_data = file_content
+        # If file_content is a path, default to its file name
+        if isinstance(file_content, str) and target_filename is None:
+            target_filename = os.path.basename(file_content)
         
         # Build full path
         if target_filename:
@@ -60,9 +132,20 @@ def upload_file_to_sharepoint(file_content, target_path, target_filename=None):
             full_path = target_path
         
         url = f"https://graph.microsoft.com/v1.0/sites/{SITE_ID}/drives/{LEADS_DRIVE_ID}/root:/{full_path}:/content"
-        response = requests.put(url, headers=headers, data=file_data)
+        
+        # If file_content is a path, stream the file from disk (an empty file
+        # is sent as bytes - requests would send an empty stream chunked,
+        # without a Content-Length)
+        if isinstance(file_content, str) and os.path.getsize(file_content) == 0:
+            response = _session.put(url, headers=headers, data=b"")
+        elif isinstance(file_content, str):
+            with open(file_content, "rb") as f:
+                response = _session.put(url, headers=headers, data=f)
+        else:
+            response = _session.put(url, headers=headers, data=file_content)
         
         if response.status_code in [200, 201]:
+            remember_etag(full_path, response)
             logging.info(f"Uploaded {target_filename or 'file'} to SharePoint: {target_path}")
             return True
         else:
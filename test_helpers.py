@@ -1,9 +1,21 @@
 # Unit tests for helper functions
 # Run with: pytest test_helpers.py -v
 
+import csv
+import os
+import orjson
 import pytest
 from country_codes import get_country_code
-from data_helpers import get_json_value, format_phone, format_date_to_iso, clean_text
+from dodge_api import process_api_projects
+from tracking import (
+    get_dr_numbers_file,
+    is_compact_dr_number,
+    read_dr_numbers,
+    load_processed_files_log,
+    save_processed_files_log,
+    prune_api_runs,
+)
+from data_helpers import get_json_value, compile_json_path, format_phone, format_zip_code, format_date_to_iso, clean_text
 
 
 # ============================================================
@@ -52,6 +64,13 @@ class TestGetCountryCode:
         """Should handle common USA variations"""
         assert get_country_code("USA") == "US"
         assert get_country_code("UNITED STATES OF AMERICA") == "US"
+    
+    def test_repeated_lookup_is_cached(self):
+        """Should serve repeated names from the cache"""
+        get_country_code("CANADA")
+        hits = get_country_code.cache_info().hits
+        assert get_country_code("CANADA") == "CA"
+        assert get_country_code.cache_info().hits == hits + 1
 
 
 # ============================================================
@@ -86,6 +105,31 @@ class TestGetJsonValue:
         assert get_json_value({}, "any", "path") == {}
 
 
+# ============================================================
+# TESTS FOR data_helpers.py - compile_json_path
+# ============================================================
+
+class TestCompileJsonPath:
+    """Tests for the compile_json_path function"""
+    
+    def test_matches_get_json_value(self):
+        """Should extract the same values as get_json_value"""
+        data = {"value": {"summary": {"dodgeReportNumber": {"ci": 1, "value": "2025001"}}}}
+        accessor = compile_json_path("value", "summary", "dodgeReportNumber")
+        assert accessor(data) == get_json_value(data, "value", "summary", "dodgeReportNumber")
+        assert accessor(data) == "2025001"
+    
+    def test_non_dict_returns_empty_string(self):
+        """Should return empty string when a non-dict is hit mid-path"""
+        accessor = compile_json_path("a", "b")
+        assert accessor({"a": "flat"}) == ""
+        assert accessor(None) == ""
+    
+    def test_same_path_reuses_accessor(self):
+        """Should compile each unique path only once"""
+        assert compile_json_path("x", "y") is compile_json_path("x", "y")
+
+
 # ============================================================
 # TESTS FOR data_helpers.py - format_phone
 # ============================================================
@@ -119,6 +163,31 @@ class TestFormatPhone:
         assert result == ""
 
 
+# ============================================================
+# TESTS FOR data_helpers.py - format_zip_code
+# ============================================================
+
+class TestFormatZipCode:
+    """Tests for the format_zip_code function"""
+    
+    def test_five_digit_string_unchanged(self):
+        """Should return a 5-digit string as-is"""
+        assert format_zip_code("38103") == "38103"
+    
+    def test_pads_short_string(self):
+        """Should zero-pad short zip strings"""
+        assert format_zip_code("501") == "00501"
+    
+    def test_pads_numeric_zip(self):
+        """Should convert numeric zips and restore leading zeros"""
+        assert format_zip_code(501) == "00501"
+    
+    def test_empty_and_none_return_empty(self):
+        """Should return empty string for missing zips"""
+        assert format_zip_code("") == ""
+        assert format_zip_code(None) == ""
+
+
 # ============================================================
 # TESTS FOR data_helpers.py - format_date_to_iso
 # ============================================================
@@ -138,6 +207,22 @@ class TestFormatDateToIso:
     def test_none_returns_empty(self):
         """Should return empty string for None input"""
         assert format_date_to_iso(None) == ""
+    
+    def test_iso_with_time_and_timezone(self):
+        """Should drop time and timezone from ISO timestamps"""
+        assert format_date_to_iso("2025-01-15T08:30:00Z") == "2025-01-15T00:00:00"
+    
+    def test_ci_value_dict(self):
+        """Should unwrap ci/value structure"""
+        assert format_date_to_iso({"ci": 1, "value": "2025-01-15"}) == "2025-01-15T00:00:00"
+    
+    def test_alternate_format(self):
+        """Should fall back to other known formats"""
+        assert format_date_to_iso("10/31/2025") == "2025-10-31T00:00:00"
+    
+    def test_invalid_calendar_date_returns_empty(self):
+        """Should return empty string for impossible dates"""
+        assert format_date_to_iso("2025-02-30") == ""
 
 
 # ============================================================
@@ -166,6 +251,10 @@ class TestCleanText:
         result = clean_text("hello\tworld")
         assert isinstance(result, str)
     
+    def test_collapses_whitespace_runs(self):
+        """Should collapse runs of spaces, tabs and newlines to one space"""
+        assert clean_text("hello   \r\n\t world") == "hello world"
+    
     def test_empty_string(self):
         """Should handle empty string"""
         assert clean_text("") == ""
@@ -181,6 +270,146 @@ class TestCleanText:
         assert result == "12345" or result == 12345
 
 
+# ============================================================
+# TESTS FOR dodge_api.py - process_api_projects
+# ============================================================
+
+class TestProcessApiProjects:
+    """Tests for the process_api_projects function"""
+    
+    correlations = {"Hospital": {"include": "Y", "segment_code": "HC"}}
+    
+    def make_project(self, dr_number, project_name, project_address):
+        """Build a minimal API project of an included type"""
+        return {
+            "value": {
+                "summary": {"dodgeReportNumber": {"ci": 1, "value": dr_number}},
+                "data": {
+                    "types": [{"primary": "Y", "value": "Hospital"}],
+                    "projectName": project_name,
+                    "locations": {"projectAddress": project_address},
+                },
+            }
+        }
+    
+    def test_plain_string_fields_do_not_drop_batch(self, tmp_path):
+        """Should blank fields that aren't ci/value dicts and keep every project"""
+        good_address = {"city": {"ci": 1, "value": "Memphis"}}
+        projects = [
+            self.make_project("1001", {"ci": 1, "value": "First"}, good_address),
+            self.make_project("1002", "Name", {"city": "Memphis", "addressLines": {"line1": "1 Main"}}),
+            self.make_project("1003", {"ci": 1, "value": "Third"}, good_address),
+        ]
+        
+        success, output_path, unique_count, _, new_dr_numbers, error = process_api_projects(
+            projects, self.correlations, set(), str(tmp_path)
+        )
+        
+        assert success and error is None
+        assert unique_count == 3
+        assert new_dr_numbers == {"1001", "1002", "1003"}
+        
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        
+        assert [row["Name"] for row in rows] == ["First", "", "Third"]
+        assert [row["Opportunity_City"] for row in rows] == ["Memphis", "", "Memphis"]
+        assert rows[1]["Opportunity_Street"] == ""
+
+
+# ============================================================
+# TESTS FOR tracking.py - DRNumber file
+# ============================================================
+
+class TestDrNumberFile:
+    """Tests for saving and loading DRNumbers across the tracking JSON and binary file"""
+    
+    def test_is_compact_dr_number(self):
+        """Should only accept DRNumbers that round-trip through a uint64"""
+        assert is_compact_dr_number("202500012345")
+        assert is_compact_dr_number("9" * 19)
+        assert not is_compact_dr_number("0123")
+        assert not is_compact_dr_number("1" * 20)
+        assert not is_compact_dr_number("DR-123")
+        assert not is_compact_dr_number("")
+    
+    def test_round_trip_mixed_dr_numbers(self, tmp_path):
+        """Should store numeric DRNumbers in the binary file and the rest in the JSON"""
+        log_file = str(tmp_path / "processed_files.json")
+        dr_numbers = {"202500012345", "9" * 19, "0123", "1" * 20, "DR-123"}
+        
+        save_processed_files_log(log_file, {"api_runs": {}, "processed_dr_numbers": set(dr_numbers)})
+        
+        assert read_dr_numbers(get_dr_numbers_file(log_file)) == {"202500012345", "9" * 19}
+        with open(log_file, "rb") as f:
+            assert orjson.loads(f.read())["processed_dr_numbers"] == ["0123", "1" * 20, "DR-123"]
+        
+        assert load_processed_files_log(log_file)["processed_dr_numbers"] == dr_numbers
+    
+    def test_migrates_old_json(self, tmp_path):
+        """Should load an old JSON listing every DRNumber and split it on save"""
+        log_file = str(tmp_path / "processed_files.json")
+        old_data = {
+            "api_runs": {"2025-01-01T00:00:00": {"status": "success"}},
+            "processed_dr_numbers": ["202500012345", "0123"],
+        }
+        with open(log_file, "wb") as f:
+            f.write(orjson.dumps(old_data))
+        
+        data = load_processed_files_log(log_file)
+        assert data["processed_dr_numbers"] == {"202500012345", "0123"}
+        
+        save_processed_files_log(log_file, data)
+        
+        assert read_dr_numbers(get_dr_numbers_file(log_file)) == {"202500012345"}
+        reloaded = load_processed_files_log(log_file)
+        assert reloaded["processed_dr_numbers"] == {"202500012345", "0123"}
+        assert reloaded["api_runs"] == old_data["api_runs"]
+    
+    def test_empty_set(self, tmp_path):
+        """Should round-trip an empty set without writing a binary file"""
+        log_file = str(tmp_path / "processed_files.json")
+        
+        save_processed_files_log(log_file, {"api_runs": {}, "processed_dr_numbers": set()})
+        
+        assert not os.path.exists(get_dr_numbers_file(log_file))
+        assert load_processed_files_log(log_file) == {"api_runs": {}, "processed_dr_numbers": set()}
+
+
+# ============================================================
+# TESTS FOR tracking.py - prune_api_runs
+# ============================================================
+
+class TestPruneApiRuns:
+    """Tests for the prune_api_runs function"""
+    
+    def test_keeps_most_recent_mixed_keys(self):
+        """Should order old ISO-keyed and new nanosecond-keyed runs by time"""
+        processed_data = {
+            "api_runs": {
+                "2025-01-01T00:00:00": {"status": "success"},
+                "2025-06-01T00:00:00": {"status": "success"},
+                "1700000000000000000": {"timestamp": "2023-11-14T22:13:20+00:00"},
+                "1760000000000000000": {"timestamp": "2025-10-09T08:53:20+00:00"},
+                "1760100000000000000": {"timestamp": "2025-10-10T12:40:00+00:00"},
+            }
+        }
+        
+        assert prune_api_runs(processed_data, max_runs=3) == 2
+        assert set(processed_data["api_runs"]) == {
+            "2025-06-01T00:00:00",
+            "1760000000000000000",
+            "1760100000000000000",
+        }
+    
+    def test_under_limit_unchanged(self):
+        """Should leave api_runs alone when within the limit"""
+        processed_data = {"api_runs": {"2025-01-01T00:00:00": {"status": "success"}}}
+        
+        assert prune_api_runs(processed_data, max_runs=3) == 0
+        assert len(processed_data["api_runs"]) == 1
+
+
 # ============================================================
 # HOW TO RUN THESE TESTS
 # ============================================================
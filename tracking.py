@@ -1,56 +1,219 @@
 # File tracking and logging utilities
 
+import array
+import hashlib
 import logging
 import os
-import json
+import sys
+import orjson
+from config import MAX_API_RUNS
 from sharepoint_helpers import upload_file_to_sharepoint
 
 
+# Numeric DRNumbers are stored as sorted little-endian uint64s in this file,
+# next to the tracking JSON (8 bytes each instead of a quoted JSON string)
+
+DR_NUMBERS_FILE = "processed_dr_numbers.bin"
+
+# Content hash of each tracking file as last known on SharePoint, by local path
+
+_synced_hashes = {}
+
+
 ##### FILE TRACKING HELPERS #####
 
 
+def get_dr_numbers_file(log_file):
+    
+    """Path of the binary DRNumber file that sits alongside the tracking JSON"""
+    
+    return os.path.join(os.path.dirname(log_file), DR_NUMBERS_FILE)
+
+
+def is_compact_dr_number(dr_number):
+    
+    """Check if a DRNumber round-trips exactly through a uint64"""
+    
+    return (
+        dr_number.isascii()
+        and dr_number.isdigit()
+        and len(dr_number) <= 19
+        and not dr_number.startswith("0")
+    )
+
+
+def read_dr_numbers(dr_numbers_file):
+    
+    """Read DRNumbers (as strings) from the binary DRNumber file"""
+    
+    dr_numbers = array.array("Q")
+    
+    with open(dr_numbers_file, "rb") as f:
+        dr_numbers.frombytes(f.read())
+    
+    if sys.byteorder == "big":
+        dr_numbers.byteswap()
+    
+    return set(map(str, dr_numbers))
+
+
+def write_dr_numbers(dr_numbers_file, dr_numbers):
+    
+    """Write numeric DRNumbers to the binary DRNumber file, sorted"""
+    
+    compact = array.array("Q", sorted(map(int, dr_numbers)))
+    
+    if sys.byteorder == "big":
+        compact.byteswap()
+    
+    with open(dr_numbers_file, "wb") as f:
+        f.write(compact.tobytes())
+
+
+def get_file_hash(file_path):
+    
+    """Get a content hash of a local file"""
+    
+    with open(file_path, "rb") as f:
+        return hashlib.blake2b(f.read()).digest()
+
+
+def mark_file_synced(file_path):
+    
+    """Record that a local file matches its SharePoint copy (e.g. just downloaded)"""
+    
+    _synced_hashes[file_path] = get_file_hash(file_path)
+
+
+def upload_if_changed(file_path, sharepoint_folder_path, force=False):
+    
+    """Upload a file to SharePoint unless its content matches the last synced copy"""
+    
+    file_hash = get_file_hash(file_path)
+    
+    if not force and _synced_hashes.get(file_path) == file_hash:
+        logging.info(f"{os.path.basename(file_path)} unchanged - skipping SharePoint upload")
+        return True
+    
+    if not upload_file_to_sharepoint(file_path, sharepoint_folder_path):
+        return False
+    
+    _synced_hashes[file_path] = file_hash
+    return True
+
+
 def load_processed_files_log(log_file):
     
     """Load the processed API runs and DRNumbers"""
     
+    data = {"api_runs": {}, "processed_dr_numbers": set()}
+    
     if os.path.exists(log_file):
         try:
-            with open(log_file, "r") as f:
-                data = json.load(f)
+            with open(log_file, "rb") as f:
+                data = orjson.loads(f.read())
                 
                 # Convert list back to set for processed_dr_numbers
-                if isinstance(data.get("processed_dr_numbers"), list):
-                    data["processed_dr_numbers"] = set(data["processed_dr_numbers"])
+                # (as strings, matching how DRNumbers are compared)
+                data["processed_dr_numbers"] = set(
+                    map(str, data.get("processed_dr_numbers") or [])
+                )
                 
                 # Ensure api_runs exists
                 if "api_runs" not in data:
                     data["api_runs"] = {}
-                
-                return data
         except:
-            return {"api_runs": {}, "processed_dr_numbers": set()}
+            data = {"api_runs": {}, "processed_dr_numbers": set()}
+    
+    # Merge in the numeric DRNumbers kept in the binary file
+    
+    dr_numbers_file = get_dr_numbers_file(log_file)
+    
+    if os.path.exists(dr_numbers_file):
+        try:
+            data["processed_dr_numbers"].update(read_dr_numbers(dr_numbers_file))
+        except Exception as e:
+            logging.error(f"Error reading {DR_NUMBERS_FILE}: {e}")
     
-    return {"api_runs": {}, "processed_dr_numbers": set()}
+    return data
 
 
-def save_processed_files_log(log_file, processed_data, sharepoint_folder_path=None):
+def get_run_time(run_key, run_entry):
+    
+    """Sortable time of an api_runs entry (older entries are keyed by ISO time)"""
+    
+    if isinstance(run_entry, dict) and run_entry.get("timestamp"):
+        return run_entry["timestamp"]
+    
+    return run_key
+
+
+def prune_api_runs(processed_data, max_runs=MAX_API_RUNS):
+    
+    """Drop all but the most recent max_runs entries from api_runs"""
+    
+    api_runs = processed_data["api_runs"]
+    
+    if len(api_runs) <= max_runs:
+        return 0
+    
+    by_time = sorted(api_runs, key=lambda run_key: get_run_time(run_key, api_runs[run_key]))
+    stale_keys = by_time[:len(api_runs) - max_runs]
     
-    """Save the API runs and DRNumbers locally and to SharePoint"""
+    for run_key in stale_keys:
+        del api_runs[run_key]
     
-    # Convert set to list for JSON serialization
+    logging.info(f"Pruned {len(stale_keys)} old API runs from tracking data")
+    return len(stale_keys)
+
+
+def save_processed_files_log(log_file, processed_data, sharepoint_folder_path=None, force=False):
+    
+    """Save the API runs and DRNumbers locally (and to SharePoint if a folder path is given)"""
+    
+    # Numeric DRNumbers go to the binary file; anything else stays in the JSON
+    compact_dr_numbers = []
+    other_dr_numbers = []
+    
+    for dr_number in processed_data["processed_dr_numbers"]:
+        if is_compact_dr_number(dr_number):
+            compact_dr_numbers.append(dr_number)
+        else:
+            other_dr_numbers.append(dr_number)
+    
+    # The binary file is only written once there are numeric DRNumbers to store
+    if compact_dr_numbers:
+        write_dr_numbers(get_dr_numbers_file(log_file), compact_dr_numbers)
+    
+    # Convert the remaining set to a sorted list for JSON serialization
     processed_data_copy = processed_data.copy()
-    processed_data_copy["processed_dr_numbers"] = list(
-        processed_data["processed_dr_numbers"]
-    )
+    processed_data_copy["processed_dr_numbers"] = sorted(other_dr_numbers)
     
-    with open(log_file, "w") as f:
-        json.dump(processed_data_copy, f, indent=2)
+    with open(log_file, "wb") as f:
+        f.write(orjson.dumps(processed_data_copy, option=orjson.OPT_SORT_KEYS))
     
     # Upload to SharePoint if folder path provided
     if sharepoint_folder_path is not None:
-        if sharepoint_folder_path == "":
-            full_path = "processed_files.json"
-        else:
-            full_path = f"{sharepoint_folder_path}/processed_files.json"
-        
-        upload_file_to_sharepoint(log_file, full_path)
\ No newline at end of file
+        sync_log_to_sharepoint(log_file, sharepoint_folder_path, force)
+
+
+def sync_log_to_sharepoint(log_file, sharepoint_folder_path="", force=False):
+    
+    """Upload the locally saved tracking files to SharePoint (unchanged files are skipped unless forced)"""
+    
+    if sharepoint_folder_path == "":
+        full_path = "processed_files.json"
+    else:
+        full_path = f"{sharepoint_folder_path}/processed_files.json"
+    
+    # Upload DRNumbers first - the JSON no longer lists them, so it must not
+    # replace the old copy unless the binary file made it
+    
+    dr_numbers_file = get_dr_numbers_file(log_file)
+    
+    if os.path.exists(dr_numbers_file):
+        if not upload_if_changed(dr_numbers_file, full_path, force):
+            logging.error("DRNumber upload failed - skipping tracking JSON upload")
+            return False
+    
+    return upload_if_changed(log_file, full_path, force)